@@ -1,8 +1,10 @@
 # pipeline/run_ingestion.py
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 
-from src.ingestion.systemd_collector import collect_systemd_logs, save_logs
+from src.ingestion.systemd_collector import iter_systemd_logs, save_logs
 from src.ingestion.docker_collector import collect_docker_logs, save_docker_logs
 from src.ingestion.gpu_collector import collect_gpu_metrics, save_gpu_metrics
 
@@ -27,6 +29,23 @@ def configure_logging() -> None:
     )
 
 
+def _collect_and_save(
+    name: str,
+    collect: Callable[..., Iterable[Dict]],
+    save: Callable[..., Optional[str]],
+    kwargs: Dict[str, Any],
+) -> None:
+    """Run one collector and persist its output."""
+    records = collect(**kwargs)
+    # Streamed collectors hand back an iterator that save() drains as it
+    # writes (save_logs warns and writes nothing if it turns out empty);
+    # list-returning collectors can be checked for emptiness first.
+    if isinstance(records, list) and not records:
+        logger.warning(f"No {name} data collected; nothing to save.")
+        return
+    save(records)
+
+
 def main() -> None:
     """Main ingestion pipeline runner."""
     configure_logging()
@@ -34,49 +53,57 @@ def main() -> None:
 
     os.makedirs(CONFIG["output_base"], exist_ok=True)
 
-    try:
-        logs = collect_systemd_logs(
-            host=CONFIG["ai_host"],
-            user=CONFIG["ai_user"],
-            ssh_key_path=CONFIG["ssh_key"],
-            unit="docker.service",
-            since_hours=24,
-        )
-        if logs:
-            save_logs(logs)
-        else:
-            logger.warning("No logs collected; nothing to save.")
-
+    ssh_args = {
+        "host": CONFIG["ai_host"],
+        "user": CONFIG["ai_user"],
+        "ssh_key_path": CONFIG["ssh_key"],
+    }
+
+    # name -> (collector, collector kwargs, saver)
+    tasks: Dict[
+        str,
+        Tuple[Callable[..., Iterable[Dict]], Dict[str, Any], Callable[..., Optional[str]]],
+    ] = {
+        # 1. systemd logs, streamed straight from journalctl to disk
+        "systemd": (
+            iter_systemd_logs,
+            {"unit": "docker.service", "since_hours": 24},
+            save_logs,
+        ),
         # 2. Docker container logs (last 60 minutes by default)
-        docker_logs = collect_docker_logs(
-            host=CONFIG["ai_host"],
-            user=CONFIG["ai_user"],
-            ssh_key_path=CONFIG["ssh_key"],
-            since_minutes=60,
-            containers=["open-webui", "ollama"],
-        )
-        if docker_logs:
-            save_docker_logs(docker_logs)
-        else:
-            logger.warning("No Docker logs collected; nothing to save.")
-
-
+        "docker": (
+            collect_docker_logs,
+            {"since_minutes": 60, "containers": ["open-webui", "ollama"]},
+            save_docker_logs,
+        ),
         # 3. GPU metrics snapshot
-        gpu_metrics = collect_gpu_metrics(
-            host=CONFIG["ai_host"],
-            user=CONFIG["ai_user"],
-            ssh_key_path=CONFIG["ssh_key"],
-        )
-        if gpu_metrics:
-            save_gpu_metrics(gpu_metrics)
-        else:
-            logger.warning("No GPU metrics collected; nothing to save.")
-
-        logger.info("Ingestion pipeline completed successfully")
-
-    except Exception as e:
-        logger.error(f"Ingestion pipeline failed: {e}")
-        raise
+        "gpu": (collect_gpu_metrics, {}, save_gpu_metrics),
+    }
+
+    # Collectors are I/O-bound and share one pooled SSH transport (one
+    # channel each), so run them concurrently: total latency becomes the
+    # slowest collector rather than the sum of all three.
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {
+            name: executor.submit(
+                _collect_and_save, name, collect, save, {**ssh_args, **kwargs}
+            )
+            for name, (collect, kwargs, save) in tasks.items()
+        }
+
+    failed = []
+    for name, future in futures.items():
+        try:
+            future.result()
+        except Exception as e:
+            logger.error(f"{name} ingestion failed: {e}")
+            failed.append((name, e))
+
+    if failed:
+        logger.error(f"Ingestion pipeline failed: {', '.join(n for n, _ in failed)}")
+        raise failed[0][1]
+
+    logger.info("Ingestion pipeline completed successfully")
 
 
 if __name__ == "__main__":
@@ -1,14 +1,22 @@
 # src/ingestion/docker_collector.py
-import json
 import logging
 import os
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional, Tuple
 
-from .remote import run_remote_command
+from ..utils.json_codec import WRITE_BUFFER_SIZE, write_jsonl
+from .remote import iter_remote_lines
 
 logger = logging.getLogger(__name__)
 
+# Sentinel that precedes each container's output in the batched docker logs call
+_FRAME = "\0CID\0"
+
+
+def _is_docker_timestamp(s: str) -> bool:
+    """Cheap check for docker's RFC3339Nano UTC timestamp prefix."""
+    return s[:4].isdigit() and s.endswith("Z")
+
 
 def _list_containers(
     host: str,
@@ -21,15 +29,13 @@ def _list_containers(
     cmd = "docker ps --format '{{.ID}} {{.Names}}'"
     logger.info(f"Listing Docker containers on {user}@{host}: {cmd}")
 
-    raw = run_remote_command(
+    containers: List[Tuple[str, str]] = []
+    for line in iter_remote_lines(
         command=cmd,
         host=host,
         user=user,
         ssh_key_path=ssh_key_path,
-    )
-
-    containers: List[Tuple[str, str]] = []
-    for line in raw.splitlines():
+    ):
         line = line.strip()
         if not line:
             continue
@@ -82,7 +88,7 @@ def collect_docker_logs(
             elif c in name_map:
                 target_containers.append((name_map[c], c))
             else:
-                logger.warning(f"Requested container {c} not found on {host}")
+                logger.warning("Requested container %s not found on %s", c, host)
 
     if not target_containers:
         logger.warning("No containers to collect logs from.")
@@ -92,39 +98,57 @@ def collect_docker_logs(
     since_dt = datetime.now(timezone.utc) - timedelta(minutes=since_minutes)
     since_ts = since_dt.isoformat()
 
-    all_logs: List[Dict] = []
+    # Fetch every container's logs in one remote exec. Each container's output
+    # is preceded by a NUL-delimited "\0CID\0<id>\0" frame on a line of its
+    # own, so each streamed line can be attributed to its container
+    # client-side. The leading newline terminates the previous container's
+    # last line even when its output did not end in one. Containers' stderr
+    # is merged into stdout (2>&1): it is part of the logs (ollama writes
+    # there), and an unread stderr stream would eventually exhaust the SSH
+    # channel window and stall the whole batch.
+    cmd = " ; ".join(
+        f"printf '\\n\\0CID\\0%s\\0\\n' {cid}; "
+        f"docker logs --since {since_ts} --timestamps {cid} 2>&1 || true"
+        for cid, _ in target_containers
+    )
+    logger.info(
+        "Collecting Docker logs from %d container(s) on %s: %s",
+        len(target_containers),
+        host,
+        cmd,
+    )
 
-    for cid, name in target_containers:
-        cmd = f"docker logs --since {since_ts} --timestamps {cid}"
-        logger.info(
-            f"Collecting Docker logs from container {name} ({cid}) on {host}: {cmd}"
-        )
-
-        try:
-            raw = run_remote_command(
-                command=cmd,
-                host=host,
-                user=user,
-                ssh_key_path=ssh_key_path,
-            )
-        except Exception as e:
-            logger.error(
-                f"Failed to collect logs for container {name} ({cid}) on {host}: {e}"
-            )
-            continue
+    names = dict(target_containers)
+    all_logs: List[Dict] = []
+    cid: Optional[str] = None
+    name: Optional[str] = None
+
+    try:
+        for line in iter_remote_lines(
+            command=cmd,
+            host=host,
+            user=user,
+            ssh_key_path=ssh_key_path,
+        ):
+            # A frame line switches the current container
+            if line.startswith(_FRAME):
+                cid = line[len(_FRAME):].rstrip("\0")
+                name = names.get(cid, cid)
+                continue
 
-        for line in raw.splitlines():
             line = line.strip()
-            if not line:
+            if not line or cid is None:
                 continue
 
             # docker logs --timestamps format is:
             # 2025-12-05T22:35:22.123456789Z message ...
             # So we split on first whitespace
-            try:
-                ts_str, msg = line.split(" ", 1)
-            except ValueError:
-                ts_str, msg = None, line
+            ts_str, _, msg = line.partition(" ")
+            if not _is_docker_timestamp(ts_str):
+                # With stderr merged, docker CLI errors (e.g. "Error response
+                # from daemon: No such container") arrive without a timestamp
+                logger.warning("docker logs for %s on %s: %s", name, host, line)
+                continue
 
             rec: Dict = {
                 "source": "docker",
@@ -135,6 +159,8 @@ def collect_docker_logs(
 		"message": msg,
             }
             all_logs.append(rec)
+    except Exception as e:
+        logger.error(f"Failed to collect Docker logs on {host}: {e}")
 
     logger.info(
         f"Collected {len(all_logs)} Docker log lines from {len(target_containers)} container(s) on {host}"
@@ -156,9 +182,8 @@ def save_docker_logs(
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_path = os.path.join(output_dir, f"docker_logs_{timestamp}.jsonl")
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        for log in logs:
-            f.write(json.dumps(log) + "\n")
+    with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        write_jsonl(f, logs)
 
     logger.info(f"Saved {len(logs)} Docker log lines to {output_path}")
     return output_path
@@ -1,10 +1,11 @@
 # src/ingestion/gpu_collector.py
-import json
+import io
 import logging
 import os
 from datetime import datetime, timezone
 from typing import List, Dict, Optional
 
+from ..utils.json_codec import WRITE_BUFFER_SIZE, write_jsonl
 from .remote import run_remote_command
 
 logger = logging.getLogger(__name__)
@@ -43,22 +44,29 @@ def collect_gpu_metrics(
         logger.error(f"Failed to collect GPU metrics from {host}: {e}")
         return []
 
-    lines = [ln.strip() for ln in raw.splitlines() if ln.strip()]
-    if not lines:
+    if not raw or raw.isspace():
         logger.warning(f"No GPU metrics returned from {host}")
         return []
 
     collected_at = datetime.now(timezone.utc).isoformat()
     metrics: List[Dict] = []
+    int_, float_ = int, float
+
+    # Iterate the output in place rather than materializing splitlines()
+    for line in io.StringIO(raw):
+        line = line.rstrip("\n")
+        if not line:
+            continue
 
-    for line in lines:
         # Example line (no units):
         # 0, NVIDIA GeForce RTX 3090, 35, 3, 1234, 24576
-        parts = [p.strip() for p in line.split(",")]
+        parts = line.split(",")
         if len(parts) != 6:
-            logger.warning(f"Unexpected nvidia-smi line format: {line}")
+            logger.warning("Unexpected nvidia-smi line format: %s", line)
             continue
 
+        # int()/float() ignore surrounding whitespace, so only the name
+        # needs stripping.
         index_str, name, temp_str, util_str, mem_used_str, mem_total_str = parts
 
         try:
@@ -66,16 +74,16 @@ def collect_gpu_metrics(
                 "source": "gpu",
 		"host": host,
 		"collected_at": collected_at,
-		"gpu_index": int(index_str),
-		"gpu_name": name,
-		"temperature_gpu_c": float(temp_str),
-		"utilization_gpu_pct": float(util_str),
-		"memory_used_mb": float(mem_used_str),
-		"memory_total_mb": float(mem_total_str),
+		"gpu_index": int_(index_str),
+		"gpu_name": name.strip(),
+		"temperature_gpu_c": float_(temp_str),
+		"utilization_gpu_pct": float_(util_str),
+		"memory_used_mb": float_(mem_used_str),
+		"memory_total_mb": float_(mem_total_str),
             }
             metrics.append(gpu_record)
         except ValueError as ve:
-            logger.warning(f"Failed to parse GPU metrics line '{line}': {ve}")
+            logger.warning("Failed to parse GPU metrics line '%s': %s", line, ve)
             continue
 
     logger.info(f"Collected GPU metrics for {len(metrics)} GPU(s) from {host}")
@@ -96,9 +104,8 @@ def save_gpu_metrics(
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_path = os.path.join(output_dir, f"gpu_metrics_{timestamp}.jsonl")
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        for rec in metrics:
-            f.write(json.dumps(rec) + "\n")
+    with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        write_jsonl(f, metrics)
 
     logger.info(f"Saved GPU metrics for {len(metrics)} GPU(s) to {output_path}")
     return output_path
@@ -1,12 +1,80 @@
 # src/ingestion/remote.py
+import atexit
 import logging
-from typing import Optional
+import threading
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
 
 import paramiko
 
 logger = logging.getLogger(__name__)
 
 
+# Pooled SSH clients keyed by (user, host, ssh_key_path). Each collector call
+# opens a new channel on the cached transport instead of reconnecting.
+_POOL: Dict[Tuple[str, str, Optional[str]], paramiko.SSHClient] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _is_alive(client: paramiko.SSHClient) -> bool:
+    """Return True if the client's transport is still usable."""
+    transport = client.get_transport()
+    if transport is None or not transport.is_active():
+        return False
+    try:
+        transport.send_ignore()
+    except Exception:
+        return False
+    return True
+
+
+def _get_client(
+    host: str,
+    user: str,
+    ssh_key_path: Optional[str] = None,
+) -> paramiko.SSHClient:
+    """
+    Return a connected SSHClient for (user, host, ssh_key_path), reusing a
+    pooled connection when it is still alive and reconnecting otherwise.
+    """
+    key = (user, host, ssh_key_path)
+
+    with _POOL_LOCK:
+        client = _POOL.get(key)
+        if client is not None:
+            if _is_alive(client):
+                return client
+            logger.info(f"Pooled SSH connection to {user}@{host} is stale; reconnecting")
+            client.close()
+            del _POOL[key]
+
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+        logger.info(f"Connecting to {user}@{host} via SSH")
+        client.connect(
+            hostname=host,
+            username=user,
+            key_filename=ssh_key_path,
+        )
+        _POOL[key] = client
+        return client
+
+
+def close_all_connections() -> None:
+    """Close every pooled SSH connection."""
+    with _POOL_LOCK:
+        for client in _POOL.values():
+            try:
+                client.close()
+            except Exception:
+                pass
+        _POOL.clear()
+
+
+atexit.register(close_all_connections)
+
+
 def run_remote_command(
     command: str,
     host: str,
@@ -16,6 +84,9 @@ def run_remote_command(
     """
     Execute a command on a remote host via SSH and return stdout.
 
+    The SSH connection is taken from a module-level pool, so repeated calls
+    against the same host share one transport.
+
     Args:
         command: Command to execute on the remote host.
         host: Remote hostname or IP.
@@ -30,18 +101,10 @@ def run_remote_command(
         RuntimeError if the command exits with non-zero status.
         Any Paramiko-related exceptions if SSH connection fails.
     """
-    client = paramiko.SSHClient()
-    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-
     try:
-        logger.info(f"Connecting to {user}@{host} via SSH")
-        client.connect(
-            hostname=host,
-            username=user,
-            key_filename=ssh_key_path,
-        )
+        client = _get_client(host, user, ssh_key_path)
 
-        logger.debug(f"Running remote command: {command}")
+        logger.debug("Running remote command: %s", command)
         stdin, stdout, stderr = client.exec_command(command)
         exit_status = stdout.channel.recv_exit_status()
 
@@ -62,5 +125,81 @@ def run_remote_command(
         logger.error(f"SSH execution failed for {user}@{host}: {e}")
         raise
 
+
+@contextmanager
+def open_remote_stdout(
+    command: str,
+    host: str,
+    user: str,
+    ssh_key_path: Optional[str] = None,
+) -> Iterator[BinaryIO]:
+    """
+    Execute a command on a remote host via SSH and expose its stdout as a
+    binary file object, for callers that need byte-level reads.
+
+    Usage:
+        with open_remote_stdout(cmd, host, user, key) as f:
+            for line in f:
+                ...
+
+    Raises:
+        RuntimeError if the command exits with non-zero status (raised when
+        the block exits normally).
+        Any Paramiko-related exceptions if SSH connection fails.
+    """
+    try:
+        client = _get_client(host, user, ssh_key_path)
+
+        logger.debug("Streaming remote command: %s", command)
+        stdin, stdout, stderr = client.exec_command(command)
+    except Exception as e:
+        logger.error(f"SSH execution failed for {user}@{host}: {e}")
+        raise
+
+    channel = stdout.channel
+    try:
+        yield channel.makefile("rb")
+
+        exit_status = channel.recv_exit_status()
+        if exit_status != 0:
+            stderr_data = stderr.read().decode()
+            logger.error(
+                f"Remote command failed on {host} with exit code {exit_status}: {stderr_data}"
+            )
+            raise RuntimeError(
+                f"Command failed on {host} (exit {exit_status}): {stderr_data}"
+            )
     finally:
-        client.close()
+        channel.close()
+
+
+def iter_remote_lines(
+    command: str,
+    host: str,
+    user: str,
+    ssh_key_path: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Execute a command on a remote host via SSH and yield stdout line by line.
+
+    Unlike run_remote_command, the output is never buffered as a whole, so
+    callers can parse and persist each line while the rest is still arriving.
+
+    Args:
+        command: Command to execute on the remote host.
+        host: Remote hostname or IP.
+        user: SSH username.
+        ssh_key_path: Path to private key (optional).
+
+    Yields:
+        Each stdout line with its trailing newline removed. Invalid UTF-8 is
+        replaced rather than raised, so one bad byte cannot abort the stream.
+
+    Raises:
+        RuntimeError if the command exits with non-zero status (raised once
+        the output has been fully consumed).
+        Any Paramiko-related exceptions if SSH connection fails.
+    """
+    with open_remote_stdout(command, host, user, ssh_key_path) as f:
+        for line in f:
+            yield line.decode("utf-8", "replace").rstrip("\n")
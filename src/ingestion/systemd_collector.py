@@ -1,24 +1,80 @@
 # src/ingestion/systemd_collector.py
-import json
+import contextlib
 import logging
 import os
+import struct
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional
 
-from .remote import run_remote_command  # note the relative import
+from ..utils.json_codec import WRITE_BUFFER_SIZE, write_jsonl
+from .remote import open_remote_stdout  # note the relative import
 
 logger = logging.getLogger(__name__)
 
 
-def collect_systemd_logs(
+def _iter_export_entries(f: BinaryIO) -> Iterator[Dict[str, str]]:
+    """
+    Parse journald's export format into one dict per journal entry.
+
+    Entries are blocks of KEY=value lines separated by a blank line. Fields
+    whose value is not printable text (e.g. multi-line messages) are written
+    as a bare KEY line followed by a little-endian uint64 length, the raw
+    payload and a newline.
+
+    Raises:
+        RuntimeError if the stream ends in the middle of a binary field, or
+        the payload is not followed by a newline (a bad size prefix).
+    """
+    cur: Dict[str, str] = {}
+    while True:
+        line = f.readline()
+        if not line:
+            break
+        if line == b"\n":
+            if cur:
+                yield cur
+                cur = {}
+            continue
+
+        if line.endswith(b"\n"):
+            line = line[:-1]
+        key, eq, value = line.partition(b"=")
+        if not eq:
+            # Binary field: size-prefixed payload follows the key line
+            header = f.read(8)
+            if len(header) < 8:
+                raise RuntimeError(
+                    f"journalctl export stream ended inside binary field {key.decode()!r}"
+                )
+            (size,) = struct.unpack("<Q", header)
+            value = f.read(size)
+            if len(value) < size:
+                raise RuntimeError(
+                    f"journalctl export stream ended inside binary field {key.decode()!r}"
+                )
+            if f.read(1) != b"\n":
+                raise RuntimeError(
+                    f"journalctl export binary field {key.decode()!r} is not newline-terminated"
+                )
+        cur[key.decode()] = value.decode("utf-8", "replace")
+
+    if cur:
+        yield cur
+
+
+def iter_systemd_logs(
     host: str,
     user: str,
     ssh_key_path: Optional[str],
     unit: str = "docker.service",
     since_hours: int = 24,
-) -> List[Dict]:
+) -> Iterator[Dict]:
     """
-    Collect systemd logs from a remote host via SSH.
+    Stream systemd log entries from a remote host via SSH.
+
+    Records are parsed and enriched as each journalctl entry arrives, so the
+    full command output is never held in memory. Pass the result straight to
+    save_logs() to write entries to disk in the same pass.
 
     Args:
         host: Remote host IP or hostname.
@@ -27,55 +83,90 @@ def collect_systemd_logs(
         unit: systemd unit name (e.g., 'docker.service').
         since_hours: How far back in time to collect logs.
 
-    Returns:
-        A list of dicts, each representing one journal entry.
+    Yields:
+        One dict per journal entry.
     """
     since_arg = f"--since '{since_hours} hours ago'"
-    cmd = f"journalctl {since_arg} -u {unit} --output=json"
+    cmd = f"journalctl {since_arg} -u {unit} --output=export"
     logger.info(f"Collecting systemd logs from {user}@{host}: {cmd}")
 
-    raw_output = run_remote_command(
+    with open_remote_stdout(
         command=cmd,
         host=host,
         user=user,
         ssh_key_path=ssh_key_path,
-    )
-
-    logs: List[Dict] = []
-    for line in raw_output.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            rec = json.loads(line)
-
+    ) as f:
+        for rec in _iter_export_entries(f):
             # Enrich each record with metadata
             rec.setdefault("host", host)
             rec.setdefault("unit", unit)
             rec["source"] = "systemd"
 
-            logs.append(rec)
-        except json.JSONDecodeError:
-            logger.warning("Skipping non-JSON line from journalctl output") 
+            yield rec
+
+
+def collect_systemd_logs(
+    host: str,
+    user: str,
+    ssh_key_path: Optional[str],
+    unit: str = "docker.service",
+    since_hours: int = 24,
+) -> List[Dict]:
+    """
+    Collect systemd logs from a remote host via SSH.
+
+    Args:
+        host: Remote host IP or hostname.
+        user: SSH username on the remote host.
+        ssh_key_path: Path to private key file (or None to use defaults).
+        unit: systemd unit name (e.g., 'docker.service').
+        since_hours: How far back in time to collect logs.
+
+    Returns:
+        A list of dicts, each representing one journal entry.
+    """
+    logs = list(iter_systemd_logs(host, user, ssh_key_path, unit, since_hours))
 
     logger.info(f"Collected {len(logs)} log entries from unit '{unit}' on {host}")
     return logs
 
 
-def save_logs(logs: List[Dict], output_dir: str = "data/ingested/systemd") -> str:
+def save_logs(
+    logs: Iterable[Dict], output_dir: str = "data/ingested/systemd"
+) -> Optional[str]:
     """
     Save logs to a JSONL file with timestamped filename.
 
+    Accepts any iterable, including the generator from iter_systemd_logs(),
+    in which case records are written as they come off the wire. Records go
+    to a temporary file that is only renamed into place once the iterable is
+    exhausted, so a collection that fails midway leaves no partial .jsonl
+    behind for preprocessing to pick up.
+
     Returns:
-        The path to the file that was written.
+        The path to the file that was written, or None if there were no logs
+        (no file is left behind in that case).
     """
     os.makedirs(output_dir, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_path = os.path.join(output_dir, f"systemd_logs_{timestamp}.jsonl")
+    tmp_path = output_path + ".tmp"
+
+    try:
+        with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            count = write_jsonl(f, logs)
+    except BaseException:
+        # open() itself may have failed; don't mask that error
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+    if count == 0:
+        os.remove(tmp_path)
+        logger.warning("No logs collected; nothing to save.")
+        return None
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        for log in logs:
-            f.write(json.dumps(log) + "\n")
+    os.replace(tmp_path, output_path)
 
-    logger.info(f"Saved {len(logs)} logs to {output_path}")
+    logger.info(f"Saved {count} logs to {output_path}")
     return output_path
@@ -1,30 +1,51 @@
 # src/preprocessing/parser.py
 
-import json
+import gzip
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import chain
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd  # NEW: for Parquet output
 
+try:
+    # Optional: columnar, multi-threaded JSON reading and Parquet writing
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.json as pa_json
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - falls back to per-record parsing
+    pa = None
+
+from ..utils.json_codec import (
+    WRITE_BUFFER_SIZE,
+    JSONDecodeError,
+    dumps,
+    loads,
+    write_jsonl_lines,
+)
+
 logger = logging.getLogger(__name__)
 
 
 # ---------- Helpers ----------
 
-def _read_jsonl(path: Path) -> Iterable[Dict]:
+def _read_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
     """Yield records from a JSONL file."""
-    with path.open("r", encoding="utf-8") as f:
+    with path.open("rb") as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            # The JSON parser tolerates the trailing newline, so only blank
+            # (whitespace-only, including "\r\n") lines need to be skipped.
+            if line.isspace():
                 continue
             try:
-                yield json.loads(line)
-            except json.JSONDecodeError:
-                logger.warning(f"Skipping invalid JSON line in {path}")
+                yield loads(line)
+            except JSONDecodeError:
+                logger.warning("Skipping invalid JSON line in %s", path)
                 continue
 
 
@@ -38,7 +59,7 @@ def _to_iso_utc_from_micros(micros_str: str) -> Optional[str]:
         return None
 
 
-def _to_iso_utc_from_iso_string(ts: str) -> Optional[str]:
+def _to_iso_utc_from_iso_string(ts: Optional[str]) -> Optional[str]:
     """
     Normalize an ISO-ish string (with 'Z', nanoseconds, etc.) to ISO UTC.
     Examples:
@@ -48,53 +69,68 @@ def _to_iso_utc_from_iso_string(ts: str) -> Optional[str]:
     if not ts:
         return None
 
+    # On Python 3.11+, fromisoformat accepts 'Z', +HHMM offsets and more
+    # than six fraction digits (truncated to microseconds) directly.
     try:
-        # Handle trailing Z
-        if ts.endswith("Z"):
-            ts = ts.replace("Z", "+00:00")
-
-        # Python's fromisoformat can't handle >6 microseconds; trim if needed
-        if "." in ts:
-            date_part, frac_part = ts.split(".", 1)
-            # frac_part might contain timezone offset, e.g. '400673015+00:00'
-            if "+" in frac_part or "-" in frac_part:
-                frac, offset = frac_part.replace("+", " +").replace("-", " -").split(" ", 1)
-                frac = frac[:6]  # microseconds
-                ts = f"{date_part}.{frac}{offset}"
-            else:
-                frac = frac_part[:6]
-                ts = f"{date_part}.{frac}"
-
         dt = datetime.fromisoformat(ts)
-        # Ensure timezone aware
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc).isoformat()
-    except Exception:
+    except ValueError:
         return None
 
+    # Ensure timezone aware
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc).isoformat()
+
+    # Fast paths for the shapes our collectors actually produce. The input has
+    # already been validated above; these are UTC and only need (at most)
+    # re-suffixing, which skips the astimezone() and isoformat() calls.
+    # isoformat() omits a zero fraction and always writes '.', so zero and
+    # comma-separated fractions go the slow way.
+    n = len(ts)
+    if (
+        dt.tzinfo is timezone.utc
+        and n in (20, 25, 30, 32)
+        and ts[10] == "T"
+        and ts[13] == ":"
+        and ts[16] == ":"
+    ):
+        # datetime.isoformat() output from the GPU collector
+        if ts.endswith("+00:00"):
+            if n == 25 or (n == 32 and ts[19] == "." and dt.microsecond):
+                return ts
+        # docker --timestamps: fixed nanosecond precision with trailing Z
+        elif ts.endswith("Z"):
+            if n == 20:
+                return ts[:19] + "+00:00"
+            if n == 30 and ts[19] == "." and dt.microsecond:
+                return ts[:26] + "+00:00"
+
+    return dt.astimezone(timezone.utc).isoformat()
+
 
 # ---------- Normalizers for each source ----------
 
-def normalize_systemd_record(rec: Dict) -> Optional[Dict]:
+def normalize_systemd_record(rec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Convert a raw systemd record into a normalized event.
     """
+    # Look up rec.get once; this runs for every record
+    g = rec.get
+
     # journald's microsecond timestamp
-    raw_ts = rec.get("__REALTIME_TIMESTAMP")
+    raw_ts = g("__REALTIME_TIMESTAMP")
     ts = _to_iso_utc_from_micros(raw_ts) if raw_ts else None
     if not ts:
         logger.debug("Skipping systemd record without valid timestamp")
         return None
 
-    host = rec.get("host") or rec.get("_HOSTNAME")
-    unit = rec.get("unit") or rec.get("UNIT") or rec.get("_SYSTEMD_UNIT")
-    message = rec.get("MESSAGE")
-    priority = rec.get("PRIORITY")
+    host = g("host") or g("_HOSTNAME")
+    unit = g("unit") or g("UNIT") or g("_SYSTEMD_UNIT")
+    message = g("MESSAGE")
+    priority = g("PRIORITY")
 
     return {
         "timestamp": ts,
-        "source": rec.get("source", "systemd"),
+        "source": g("source") or "systemd",
         "host": host,
         "category": "log",
         "subtype": "systemd",
@@ -105,7 +141,7 @@ def normalize_systemd_record(rec: Dict) -> Optional[Dict]:
     }
 
 
-def normalize_docker_record(rec: Dict) -> Optional[Dict]:
+def normalize_docker_record(rec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Convert a raw docker record into a normalized event.
     Expected fields from your collector:
@@ -116,7 +152,8 @@ def normalize_docker_record(rec: Dict) -> Optional[Dict]:
       - message
       - source = 'docker'
     """
-    raw_ts = rec.get("timestamp")
+    g = rec.get
+    raw_ts = g("timestamp")
     ts = _to_iso_utc_from_iso_string(raw_ts) if raw_ts else None
     if not ts:
         logger.debug("Skipping docker record without valid timestamp")
@@ -124,17 +161,17 @@ def normalize_docker_record(rec: Dict) -> Optional[Dict]:
 
     return {
         "timestamp": ts,
-        "source": rec.get("source", "docker"),
-        "host": rec.get("host"),
+        "source": g("source") or "docker",
+        "host": g("host"),
         "category": "log",
         "subtype": "docker",
-        "container_name": rec.get("container_name"),
-        "container_id": rec.get("container_id"),
-        "message": rec.get("message"),
+        "container_name": g("container_name"),
+        "container_id": g("container_id"),
+        "message": g("message"),
     }
 
 
-def normalize_gpu_record(rec: Dict) -> Optional[Dict]:
+def normalize_gpu_record(rec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Convert a GPU metrics record into a normalized event.
     Expected fields from your collector:
@@ -148,7 +185,8 @@ def normalize_gpu_record(rec: Dict) -> Optional[Dict]:
       - memory_total_mb
       - source = 'gpu'
     """
-    raw_ts = rec.get("collected_at")
+    g = rec.get
+    raw_ts = g("collected_at")
     ts = _to_iso_utc_from_iso_string(raw_ts) if raw_ts else None
     if not ts:
         logger.debug("Skipping gpu record without valid timestamp")
@@ -156,33 +194,296 @@ def normalize_gpu_record(rec: Dict) -> Optional[Dict]:
 
     return {
         "timestamp": ts,
-        "source": rec.get("source", "gpu"),
-        "host": rec.get("host"),
+        "source": g("source") or "gpu",
+        "host": g("host"),
         "category": "metric",
         "subtype": "gpu",
-        "gpu_index": rec.get("gpu_index"),
-        "gpu_name": rec.get("gpu_name"),
-        "temperature_gpu_c": rec.get("temperature_gpu_c"),
-        "utilization_gpu_pct": rec.get("utilization_gpu_pct"),
-        "memory_used_mb": rec.get("memory_used_mb"),
-        "memory_total_mb": rec.get("memory_total_mb"),
+        "gpu_index": g("gpu_index"),
+        "gpu_name": g("gpu_name"),
+        "temperature_gpu_c": g("temperature_gpu_c"),
+        "utilization_gpu_pct": g("utilization_gpu_pct"),
+        "memory_used_mb": g("memory_used_mb"),
+        "memory_total_mb": g("memory_total_mb"),
     }
 
 
 # ---------- Top-level processing functions ----------
 
+_NORMALIZERS: Dict[str, Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]] = {
+    "systemd": normalize_systemd_record,
+    "docker": normalize_docker_record,
+    "gpu": normalize_gpu_record,
+}
+
+
+def _normalize_file(path: Path, kind: str) -> List[Dict[str, Any]]:
+    """Read one raw JSONL file record by record and normalize each event."""
+    normalize = _NORMALIZERS[kind]
+
+    events: List[Dict[str, Any]] = []
+    for rec in _read_jsonl(path):
+        norm = normalize(rec)
+        if norm is None:
+            continue
+        events.append(norm)
+    return events
+
+
+def _process_file(path: Path, kind: str) -> List[Dict[str, Any]]:
+    """
+    Read one raw JSONL file and return its normalized events.
+    Runs inside a worker process, so it must stay at module level.
+    """
+    logger.info(f"Processing {kind} file: {path}")
+    return _normalize_file(path, kind)
+
+
+# ---------- Columnar (PyArrow) processing ----------
+
+# Raw fields read per source; everything else in the file is ignored.
+_ARROW_FIELDS: Dict[str, List[Tuple[str, str]]] = {
+    "systemd": [
+        ("__REALTIME_TIMESTAMP", "string"),
+        ("source", "string"),
+        ("host", "string"),
+        ("_HOSTNAME", "string"),
+        ("unit", "string"),
+        ("UNIT", "string"),
+        ("_SYSTEMD_UNIT", "string"),
+        ("MESSAGE", "string"),
+        ("PRIORITY", "string"),
+    ],
+    "docker": [
+        ("timestamp", "string"),
+        ("source", "string"),
+        ("host", "string"),
+        ("container_name", "string"),
+        ("container_id", "string"),
+        ("message", "string"),
+    ],
+    "gpu": [
+        ("collected_at", "string"),
+        ("source", "string"),
+        ("host", "string"),
+        ("gpu_index", "int64"),
+        ("gpu_name", "string"),
+        ("temperature_gpu_c", "double"),
+        ("utilization_gpu_pct", "double"),
+        ("memory_used_mb", "double"),
+        ("memory_total_mb", "double"),
+    ],
+}
+
+# Timestamps the vectorized path can parse exactly like the per-record path
+_ARROW_MICROS_PATTERN = r"^\d+$"
+_ARROW_ISO_PATTERN = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})$"
+
+
+def _arrow_valid_rows(table: "pa.Table", field: str, pattern: str) -> Optional["pa.Table"]:
+    """
+    Drop rows with a null/empty timestamp field. Returns None if any remaining
+    value does not match pattern, so the caller can fall back to per-record
+    parsing for that file.
+    """
+    table = table.filter(pc.not_equal(table.column(field), ""))
+    if not pc.all(pc.match_substring_regex(table.column(field), pattern)).as_py():
+        return None
+    return table
+
+
+def _arrow_coalesce(
+    table: "pa.Table", *fields: str, default: Optional[str] = None
+) -> "pa.ChunkedArray":
+    """Vectorized `rec.get(a) or rec.get(b) or default` over string columns."""
+    cols = []
+    for field in fields:
+        col = table.column(field)
+        cols.append(pc.if_else(pc.equal(col, ""), pa.scalar(None, col.type), col))
+    if default is not None:
+        cols.append(pa.scalar(default))
+    return pc.coalesce(*cols)
+
+
+def _arrow_iso_utc(ts: "pa.ChunkedArray") -> "pa.ChunkedArray":
+    """Format a timestamp[us, UTC] column exactly like datetime.isoformat()."""
+    formatted = pc.strftime(ts, format="%Y-%m-%dT%H:%M:%S+00:00")
+    # isoformat() omits the fraction when microseconds are zero
+    return pc.replace_substring_regex(formatted, pattern=r"\.000000\+", replacement="+")
+
+
+def _arrow_normalize_systemd(table: "pa.Table") -> Optional["pa.Table"]:
+    table = _arrow_valid_rows(table, "__REALTIME_TIMESTAMP", _ARROW_MICROS_PATTERN)
+    if table is None:
+        return None
+
+    micros = pc.cast(table.column("__REALTIME_TIMESTAMP"), pa.int64())
+    n = table.num_rows
+    return pa.table({
+        "timestamp": _arrow_iso_utc(pc.cast(micros, pa.timestamp("us", tz="UTC"))),
+        "source": _arrow_coalesce(table, "source", default="systemd"),
+        "host": _arrow_coalesce(table, "host", "_HOSTNAME"),
+        "category": pa.repeat("log", n),
+        "subtype": pa.repeat("systemd", n),
+        "severity": table.column("PRIORITY"),
+        "unit": _arrow_coalesce(table, "unit", "UNIT", "_SYSTEMD_UNIT"),
+        "message": table.column("MESSAGE"),
+    })
+
+
+def _arrow_iso_timestamps(table: "pa.Table", field: str) -> "pa.ChunkedArray":
+    """Parse RFC3339 strings, truncating to microseconds like the Python path."""
+    ts = pc.cast(table.column(field), pa.timestamp("ns", tz="UTC"))
+    return _arrow_iso_utc(pc.cast(ts, pa.timestamp("us", tz="UTC"), safe=False))
+
+
+def _arrow_normalize_docker(table: "pa.Table") -> Optional["pa.Table"]:
+    table = _arrow_valid_rows(table, "timestamp", _ARROW_ISO_PATTERN)
+    if table is None:
+        return None
+
+    n = table.num_rows
+    return pa.table({
+        "timestamp": _arrow_iso_timestamps(table, "timestamp"),
+        "source": _arrow_coalesce(table, "source", default="docker"),
+        "host": table.column("host"),
+        "category": pa.repeat("log", n),
+        "subtype": pa.repeat("docker", n),
+        "container_name": table.column("container_name"),
+        "container_id": table.column("container_id"),
+        "message": table.column("message"),
+    })
+
+
+def _arrow_normalize_gpu(table: "pa.Table") -> Optional["pa.Table"]:
+    table = _arrow_valid_rows(table, "collected_at", _ARROW_ISO_PATTERN)
+    if table is None:
+        return None
+
+    n = table.num_rows
+    return pa.table({
+        "timestamp": _arrow_iso_timestamps(table, "collected_at"),
+        "source": _arrow_coalesce(table, "source", default="gpu"),
+        "host": table.column("host"),
+        "category": pa.repeat("metric", n),
+        "subtype": pa.repeat("gpu", n),
+        "gpu_index": table.column("gpu_index"),
+        "gpu_name": table.column("gpu_name"),
+        "temperature_gpu_c": table.column("temperature_gpu_c"),
+        "utilization_gpu_pct": table.column("utilization_gpu_pct"),
+        "memory_used_mb": table.column("memory_used_mb"),
+        "memory_total_mb": table.column("memory_total_mb"),
+    })
+
+
+_ARROW_NORMALIZERS = {
+    "systemd": _arrow_normalize_systemd,
+    "docker": _arrow_normalize_docker,
+    "gpu": _arrow_normalize_gpu,
+}
+
+
+def _arrow_serialize_rows(table: "pa.Table") -> List[bytes]:
+    """
+    Serialize each row of a normalized table to JSON bytes without building
+    an intermediate dict per row.
+
+    Rows are rendered through a template fixed by the table's columns, so only
+    the values are serialized. Low-cardinality columns (category, subtype,
+    host, unit, ...) are serialized once per distinct value.
+    """
+    template = b"{" + b",".join(dumps(name) + b":%b" for name in table.column_names) + b"}"
+
+    columns: List[List[bytes]] = []
+    for col in table.columns:
+        encoded = col.combine_chunks().dictionary_encode()
+        if len(encoded.dictionary) * 4 < len(encoded):
+            values = [dumps(v) for v in encoded.dictionary.to_pylist()]
+            values.append(b"null")
+            indices = encoded.indices.fill_null(len(values) - 1).to_pylist()
+            columns.append([values[i] for i in indices])
+        else:
+            columns.append(list(map(dumps, col.to_pylist())))
+
+    return [template % row for row in zip(*columns)]
+
+
+def _process_file_arrow(
+    path: Path, kind: str
+) -> Union["pa.Table", List[Dict[str, Any]]]:
+    """
+    Read one raw JSONL file with PyArrow and normalize it column-wise.
+
+    Files the vectorized path cannot handle exactly (invalid JSON lines,
+    unexpected value types, unusual timestamp formats) are normalized record
+    by record instead and returned as a list of event dicts, so the JSONL
+    output matches _process_file either way.
+    Runs inside a worker process, so it must stay at module level.
+    """
+    logger.info(f"Processing {kind} file: {path}")
+
+    schema = pa.schema(
+        [(name, pa.type_for_alias(type_)) for name, type_ in _ARROW_FIELDS[kind]]
+    )
+    parse_options = pa_json.ParseOptions(
+        explicit_schema=schema,
+        unexpected_field_behavior="ignore",
+    )
+
+    try:
+        table = pa_json.read_json(path, parse_options=parse_options)
+        normalized = _ARROW_NORMALIZERS[kind](table)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        logger.debug(f"Columnar parsing failed for {path}: {e}")
+        normalized = None
+
+    if normalized is None:
+        logger.info(f"Falling back to per-record parsing for {path}")
+        return _normalize_file(path, kind)
+    return normalized
+
+
+def _records_to_table(events: List[Dict[str, Any]]) -> "pa.Table":
+    """
+    Build a Parquet-ready Table from per-record events.
+
+    Lists and dicts (e.g. a binary journald MESSAGE that the old JSON
+    collector stored as a list of byte values) are stored as JSON text, and
+    a column that still mixes value types is stored as strings.
+    """
+    names: Dict[str, None] = {}
+    for ev in events:
+        names.update(dict.fromkeys(ev))
+
+    columns: Dict[str, "pa.Array"] = {}
+    for name in names:
+        values = [ev.get(name) for ev in events]
+        values = [
+            dumps(v).decode() if isinstance(v, (list, dict)) else v for v in values
+        ]
+        try:
+            columns[name] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            logger.warning("Storing mixed-type column %s as strings in Parquet", name)
+            columns[name] = pa.array(
+                [v if v is None or isinstance(v, str) else dumps(v).decode() for v in values],
+                pa.string(),
+            )
+    return pa.table(columns)
+
+
 @dataclass
 class PreprocessConfig:
     ingested_root: Path = Path("data/ingested")
     processed_root: Path = Path("data/processed")
-    output_filename_jsonl: str = "combined_events.jsonl"
+    output_filename_jsonl: str = "combined_events.jsonl.gz"
     output_filename_parquet: str = "combined_events.parquet"
 
 
 def process_all(config: Optional[PreprocessConfig] = None) -> Path:
     """
     Read raw ingested JSONL logs (systemd, docker, gpu),
-    normalize them to a unified schema, and write a combined JSONL file,
+    normalize them to a unified schema, and write a combined JSONL file
+    (gzip-compressed when the filename ends in .gz, the default),
     and also write a Parquet file for analytics/ML use.
 
     Returns:
@@ -203,57 +504,62 @@ def process_all(config: Optional[PreprocessConfig] = None) -> Path:
 
     logger.info(f"Starting preprocessing. JSONL -> {jsonl_path}, Parquet -> {parquet_path}")
 
-    total_written = 0
-    all_events: List[Dict] = []
-
-    # ---- Systemd logs ----
-    if systemd_dir.exists():
-        for path in sorted(systemd_dir.glob("*.jsonl")):
-            logger.info(f"Processing systemd file: {path}")
-            for rec in _read_jsonl(path):
-                norm = normalize_systemd_record(rec)
-                if norm is None:
-                    continue
-                all_events.append(norm)
-                total_written += 1
-
-    # ---- Docker logs ----
-    if docker_dir.exists():
-        for path in sorted(docker_dir.glob("*.jsonl")):
-            logger.info(f"Processing docker file: {path}")
-            for rec in _read_jsonl(path):
-                norm = normalize_docker_record(rec)
-                if norm is None:
-                    continue
-                all_events.append(norm)
-                total_written += 1
-
-    # ---- GPU metrics ----
-    if gpu_dir.exists():
-        for path in sorted(gpu_dir.glob("*.jsonl")):
-            logger.info(f"Processing gpu file: {path}")
-            for rec in _read_jsonl(path):
-                norm = normalize_gpu_record(rec)
-                if norm is None:
-                    continue
-                all_events.append(norm)
-                total_written += 1
+    # One task per raw file, in source order (systemd, docker, gpu) so the
+    # combined output keeps the same ordering as a sequential run.
+    tasks: List[Tuple[Path, str]] = []
+    for kind, source_dir in (
+        ("systemd", systemd_dir),
+        ("docker", docker_dir),
+        ("gpu", gpu_dir),
+    ):
+        if source_dir.exists():
+            tasks.extend((path, kind) for path in sorted(source_dir.glob("*.jsonl")))
+
+    # Files are independent and parsing is CPU-bound, so normalize them in
+    # parallel worker processes and concatenate the results in task order.
+    # With PyArrow a worker returns a normalized Table, or a list of event
+    # dicts for files that needed per-record parsing; without it, always a
+    # list of event dicts.
+    process_file = _process_file_arrow if pa is not None else _process_file
+    results: List[Union["pa.Table", List[Dict[str, Any]]]] = []
+    if tasks:
+        max_workers = min(len(tasks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(process_file, *zip(*tasks)))
+
+    results = [result for result in results if len(result)]
+    lines: Iterable[bytes] = chain.from_iterable(
+        map(dumps, result) if isinstance(result, list) else _arrow_serialize_rows(result)
+        for result in results
+    )
 
     # ---- Write JSONL ----
-    with jsonl_path.open("w", encoding="utf-8") as out_f:
-        for ev in all_events:
-            out_f.write(json.dumps(ev) + "\n")
-
+    # Gzip at level 1: the repetitive keys compress well for little CPU.
+    # Plain .jsonl is still written if the configured filename asks for it.
+    out_f: Union[gzip.GzipFile, BinaryIO]
+    if jsonl_path.suffix == ".gz":
+        out_f = gzip.open(jsonl_path, "wb", compresslevel=1)
+    else:
+        out_f = jsonl_path.open("wb", buffering=WRITE_BUFFER_SIZE)
+    with out_f:
+        total_written = write_jsonl_lines(out_f, lines)
 
     logger.info(f"Wrote {total_written} events to JSONL at {jsonl_path}")
 
     # ---- Write Parquet ----
-    if all_events:
-        df = pd.DataFrame(all_events)
+    if not total_written:
+        logger.warning("No events to write; skipping Parquet generation")
+    elif pa is not None:
+        table = pa.concat_tables(
+            [_records_to_table(r) if isinstance(r, list) else r for r in results],
+            promote_options="permissive",
+        )
+        pq.write_table(table, parquet_path)
+        logger.info(f"Wrote {table.num_rows} events to Parquet at {parquet_path}")
+    else:
+        df = pd.DataFrame([ev for events in results for ev in events])
         df.to_parquet(parquet_path, index=False)
         logger.info(f"Wrote {len(df)} events to Parquet at {parquet_path}")
-    else:
-        logger.warning("No events to write; skipping Parquet generation")
 
     logger.info("Preprocessing completed.")
     return jsonl_path
@@ -0,0 +1,81 @@
+# src/utils/json_codec.py
+import json
+from typing import Any, Iterable, List, Protocol, Union
+
+try:
+    import orjson  # optional: much faster JSON parsing/serialization
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# always catch this one type regardless of which backend is active.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class BytesWriter(Protocol):
+    """Any binary sink: open(..., "wb"), gzip.open(..., "wb"), BytesIO, ..."""
+
+    def write(self, data: bytes, /) -> int: ...
+
+
+# Output buffer for JSONL files and number of records serialized per write().
+WRITE_BUFFER_SIZE = 1 << 20
+WRITE_BATCH_SIZE = 1000
+
+
+def _flush_batch(f: BytesWriter, chunks: List[bytes]) -> None:
+    """Write a batch of serialized records as newline-terminated lines."""
+    # The empty sentinel makes join() emit the trailing newline too, so the
+    # batch is sized once and copied into a single buffer for one write().
+    chunks.append(b"")
+    f.write(b"\n".join(chunks))
+    chunks.clear()
+
+
+def write_jsonl_lines(f: BytesWriter, lines: Iterable[bytes]) -> int:
+    """
+    Write already-serialized JSON records to an open binary file as JSONL.
+
+    Lines are joined in batches of WRITE_BATCH_SIZE and each batch is written
+    at once rather than issuing a write() per record.
+
+    Returns:
+        Number of records written.
+    """
+    count = 0
+    chunks: List[bytes] = []
+    for line in lines:
+        chunks.append(line)
+        if len(chunks) >= WRITE_BATCH_SIZE:
+            count += len(chunks)
+            _flush_batch(f, chunks)
+
+    if chunks:
+        count += len(chunks)
+        _flush_batch(f, chunks)
+
+    return count
+
+
+def write_jsonl(f: BytesWriter, records: Iterable[Any]) -> int:
+    """
+    Serialize records to an open binary file as JSONL.
+
+    Returns:
+        Number of records written.
+    """
+    return write_jsonl_lines(f, map(dumps, records))
@@ -0,0 +1,82 @@
+import pytest
+
+from src.ingestion import docker_collector
+
+
+def _stream(outputs):
+    """Reproduce the batched command's stdout for (cid, output) pairs."""
+    return "".join(f"\n\0CID\0{cid}\0\n{out}" for cid, out in outputs)
+
+
+@pytest.fixture
+def collect(monkeypatch):
+    def run(outputs, containers=(("aaa", "web"), ("bbb", "db"))):
+        calls = []
+
+        def fake_iter_remote_lines(command, host, user, ssh_key_path):
+            calls.append(command)
+            # iter_remote_lines yields lines without their trailing newline
+            yield from _stream(outputs).split("\n")
+
+        monkeypatch.setattr(
+            docker_collector, "_list_containers", lambda *a: list(containers)
+        )
+        monkeypatch.setattr(
+            docker_collector, "iter_remote_lines", fake_iter_remote_lines
+        )
+        logs = docker_collector.collect_docker_logs("ai-box", "user", None)
+        return logs, calls
+
+    return run
+
+
+def _pairs(logs):
+    return [(r["container_name"], r["timestamp"], r["message"]) for r in logs]
+
+
+def test_frames_are_emitted_on_their_own_line(collect):
+    _, calls = collect([])
+    assert "printf '\\n\\0CID\\0%s\\0\\n' aaa;" in calls[0]
+    assert "printf '\\n\\0CID\\0%s\\0\\n' bbb;" in calls[0]
+
+
+def test_output_without_trailing_newline_does_not_swallow_next_frame(collect):
+    logs, _ = collect(
+        [
+            ("aaa", "2025-12-06T17:08:56.1Z first\n2025-12-06T17:08:57.1Z partial-no-newline"),
+            ("bbb", "2025-12-06T17:08:58.1Z from bbb\n"),
+        ]
+    )
+    assert _pairs(logs) == [
+        ("web", "2025-12-06T17:08:56.1Z", "first"),
+        ("web", "2025-12-06T17:08:57.1Z", "partial-no-newline"),
+        ("db", "2025-12-06T17:08:58.1Z", "from bbb"),
+    ]
+    assert [r["container_id"] for r in logs] == ["aaa", "aaa", "bbb"]
+
+
+def test_empty_container_yields_no_records(collect):
+    logs, _ = collect(
+        [
+            ("aaa", ""),
+            ("bbb", "2025-12-06T17:08:58.1Z from bbb\n"),
+        ]
+    )
+    assert _pairs(logs) == [("db", "2025-12-06T17:08:58.1Z", "from bbb")]
+
+
+def test_unknown_cid_falls_back_to_id_as_name(collect):
+    logs, _ = collect([("zzz", "2025-12-06T17:08:58.1Z hello\n")])
+    assert [(r["container_id"], r["container_name"]) for r in logs] == [("zzz", "zzz")]
+
+
+def test_docker_cli_errors_are_logged_not_saved(collect, caplog):
+    with caplog.at_level("WARNING"):
+        logs, _ = collect(
+            [
+                ("aaa", "Error response from daemon: No such container: aaa\n"),
+                ("bbb", "2025-12-06T17:08:58.1Z from bbb\n"),
+            ]
+        )
+    assert _pairs(logs) == [("db", "2025-12-06T17:08:58.1Z", "from bbb")]
+    assert "No such container" in caplog.text
@@ -0,0 +1,89 @@
+import io
+import struct
+
+import pytest
+
+from src.ingestion.systemd_collector import _iter_export_entries
+
+
+def _binary_field(key: bytes, payload: bytes) -> bytes:
+    return key + b"\n" + struct.pack("<Q", len(payload)) + payload + b"\n"
+
+
+def _parse(data: bytes):
+    return list(_iter_export_entries(io.BytesIO(data)))
+
+
+def test_text_fields_and_blank_line_separated_entries():
+    data = (
+        b"__REALTIME_TIMESTAMP=1733504936400673\n"
+        b"_HOSTNAME=ai-box\n"
+        b"MESSAGE=started\n"
+        b"\n"
+        b"__REALTIME_TIMESTAMP=1733504936400674\n"
+        b"MESSAGE=stopped\n"
+        b"\n"
+    )
+    assert _parse(data) == [
+        {
+            "__REALTIME_TIMESTAMP": "1733504936400673",
+            "_HOSTNAME": "ai-box",
+            "MESSAGE": "started",
+        },
+        {"__REALTIME_TIMESTAMP": "1733504936400674", "MESSAGE": "stopped"},
+    ]
+
+
+def test_equals_sign_inside_value_is_kept():
+    assert _parse(b"MESSAGE=key=value a=b\n\n") == [{"MESSAGE": "key=value a=b"}]
+
+
+def test_binary_field_with_length_prefix():
+    payload = b"line one\nline two\n=not a field"
+    data = (
+        b"PRIORITY=3\n"
+        + _binary_field(b"MESSAGE", payload)
+        + b"_SYSTEMD_UNIT=docker.service\n"
+        b"\n"
+    )
+    assert _parse(data) == [
+        {
+            "PRIORITY": "3",
+            "MESSAGE": payload.decode(),
+            "_SYSTEMD_UNIT": "docker.service",
+        }
+    ]
+
+
+def test_final_entry_without_trailing_blank_line():
+    data = b"MESSAGE=first\n\nMESSAGE=last\nPRIORITY=6\n"
+    assert _parse(data) == [
+        {"MESSAGE": "first"},
+        {"MESSAGE": "last", "PRIORITY": "6"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"MESSAGE\n" + struct.pack("<Q", 10)[:5],
+        b"MESSAGE\n" + struct.pack("<Q", 10) + b"short",
+    ],
+    ids=["truncated-length", "truncated-payload"],
+)
+def test_truncated_binary_field_raises(data):
+    with pytest.raises(RuntimeError, match="MESSAGE"):
+        _parse(data)
+
+
+def test_binary_field_with_bad_size_prefix_raises():
+    # Size one byte short, so the byte after the payload is not the newline
+    data = (
+        b"MESSAGE\n"
+        + struct.pack("<Q", 4)
+        + b"hello\n"
+        + b"PRIORITY=6\n"
+        b"\n"
+    )
+    with pytest.raises(RuntimeError, match="MESSAGE"):
+        _parse(data)
@@ -0,0 +1,211 @@
+import gzip
+import importlib
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.preprocessing import parser
+from src.preprocessing.parser import (
+    PreprocessConfig,
+    _process_file,
+    _process_file_arrow,
+    _read_jsonl,
+    process_all,
+)
+
+SYSTEMD = [
+    {
+        "__REALTIME_TIMESTAMP": "1733504936400673",
+        "_HOSTNAME": "ai-box",
+        "MESSAGE": 'Started "ollama"',
+        "PRIORITY": "6",
+        "unit": "docker.service",
+        "source": "systemd",
+        "host": "172.16.0.20",
+    },
+    {
+        "__REALTIME_TIMESTAMP": "1733504937000000",
+        "_HOSTNAME": "ai-box",
+        "_SYSTEMD_UNIT": "docker.service",
+        "MESSAGE": "no unit/host override, zero microseconds",
+        "PRIORITY": "3",
+        "source": "systemd",
+        "host": "",
+    },
+    {"MESSAGE": "no timestamp, dropped"},
+]
+
+DOCKER = [
+    {
+        "source": "docker",
+        "host": "172.16.0.20",
+        "container_id": "abc123",
+        "container_name": "ollama",
+        "timestamp": "2025-12-06T17:08:56.400673015Z",
+        "message": "listening on 127.0.0.1:11434 é",
+    },
+    {
+        "source": "docker",
+        "host": "172.16.0.20",
+        "container_id": "abc123",
+        "container_name": "ollama",
+        "timestamp": None,
+        "message": "no timestamp, dropped",
+    },
+]
+
+GPU = [
+    {
+        "source": "gpu",
+        "host": "172.16.0.20",
+        "collected_at": "2025-12-06T17:08:56.123456+00:00",
+        "gpu_index": 0,
+        "gpu_name": "NVIDIA GeForce RTX 3090",
+        "temperature_gpu_c": 35.0,
+        "utilization_gpu_pct": 3.0,
+        "memory_used_mb": 1234.0,
+        "memory_total_mb": 24576.0,
+    },
+]
+
+# Written by the old --output=json collector: journald serialized a binary
+# MESSAGE as a list of byte values. Arrow cannot parse it with the string
+# schema, so this file takes the per-record fallback.
+SYSTEMD_BINARY_MESSAGE = [
+    {
+        "__REALTIME_TIMESTAMP": "1733504938000001",
+        "_HOSTNAME": "ai-box",
+        "MESSAGE": [104, 105, 10],
+        "PRIORITY": "4",
+        "source": "systemd",
+    },
+    {
+        "__REALTIME_TIMESTAMP": "1733504938000002",
+        "_HOSTNAME": "ai-box",
+        "MESSAGE": "plain text",
+        "PRIORITY": "6",
+        "source": "systemd",
+    },
+]
+
+
+def _write_jsonl(path: Path, records, extra_lines=()):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [json.dumps(r) for r in records] + list(extra_lines)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def ingested(tmp_path):
+    root = tmp_path / "ingested"
+    _write_jsonl(root / "systemd" / "a.jsonl", SYSTEMD)
+    _write_jsonl(root / "systemd" / "b.jsonl", SYSTEMD_BINARY_MESSAGE)
+    _write_jsonl(root / "systemd" / "c.jsonl", SYSTEMD, extra_lines=["not json", "\r", "  "])
+    _write_jsonl(root / "docker" / "a.jsonl", DOCKER)
+    _write_jsonl(root / "gpu" / "a.jsonl", GPU)
+    return root
+
+
+@pytest.fixture
+def pyarrow():
+    return pytest.importorskip("pyarrow")
+
+
+def _parquet_engine():
+    for name in ("pyarrow", "fastparquet"):
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        return name
+    pytest.skip("no Parquet engine installed")
+
+
+def _expected_events(ingested, files):
+    expected = []
+    for relpath, kind in files:
+        expected.extend(_process_file(ingested / relpath, kind))
+    return expected
+
+
+def _read_combined_jsonl(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+ALL_FILES = [
+    ("systemd/a.jsonl", "systemd"),
+    ("systemd/b.jsonl", "systemd"),
+    ("systemd/c.jsonl", "systemd"),
+    ("docker/a.jsonl", "docker"),
+    ("gpu/a.jsonl", "gpu"),
+]
+
+
+def _as_records(result):
+    return result if isinstance(result, list) else result.to_pylist()
+
+
+@pytest.mark.parametrize("relpath, kind", ALL_FILES)
+def test_arrow_path_matches_per_record_path(pyarrow, ingested, relpath, kind):
+    path = ingested / relpath
+    assert _as_records(_process_file_arrow(path, kind)) == _process_file(path, kind)
+
+
+def test_fallback_file_returns_per_record_events(pyarrow, ingested):
+    result = _process_file_arrow(ingested / "systemd" / "b.jsonl", "systemd")
+    assert isinstance(result, list)
+    assert result[0]["message"] == [104, 105, 10]
+
+
+def test_process_all_writes_jsonl_and_parquet(pyarrow, ingested, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    config = PreprocessConfig(ingested_root=ingested, processed_root=tmp_path / "out")
+    jsonl_path = process_all(config)
+
+    expected = _expected_events(ingested, ALL_FILES)
+    assert _read_combined_jsonl(jsonl_path) == expected
+
+    table = pq.read_table(tmp_path / "out" / config.output_filename_parquet)
+    assert table.num_rows == len(expected)
+    # the binary message is kept as JSON text in the string column
+    assert "[104,105,10]" in table.column("message").to_pylist()
+
+
+def test_process_all_without_pyarrow_uses_pandas(ingested, tmp_path, monkeypatch):
+    engine = _parquet_engine()
+    monkeypatch.setattr(parser, "pa", None)
+    # pandas cannot write the old list-valued binary MESSAGE next to strings
+    (ingested / "systemd" / "b.jsonl").unlink()
+    files = [f for f in ALL_FILES if f[0] != "systemd/b.jsonl"]
+
+    config = PreprocessConfig(ingested_root=ingested, processed_root=tmp_path / "out")
+    jsonl_path = process_all(config)
+
+    expected = _expected_events(ingested, files)
+    assert _read_combined_jsonl(jsonl_path) == expected
+
+    df = pd.read_parquet(tmp_path / "out" / config.output_filename_parquet, engine=engine)
+    assert len(df) == len(expected)
+    assert df["timestamp"].tolist() == [ev["timestamp"] for ev in expected]
+
+
+def test_read_jsonl_skips_blank_lines_silently(tmp_path, caplog):
+    path = tmp_path / "blank.jsonl"
+    path.write_bytes(b'{"a": 1}\r\n\r\n   \n\t\n{"a": 2}\n\n')
+
+    with caplog.at_level("WARNING"):
+        assert list(_read_jsonl(path)) == [{"a": 1}, {"a": 2}]
+    assert caplog.records == []
+
+
+def test_read_jsonl_warns_on_invalid_line(tmp_path, caplog):
+    path = tmp_path / "invalid.jsonl"
+    path.write_bytes(b'{"a": 1}\nnot json\n')
+
+    with caplog.at_level("WARNING"):
+        assert list(_read_jsonl(path)) == [{"a": 1}]
+    assert len(caplog.records) == 1
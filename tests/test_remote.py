@@ -0,0 +1,18 @@
+import io
+from contextlib import contextmanager
+
+from src.ingestion import remote
+
+
+def test_iter_remote_lines_replaces_invalid_utf8(monkeypatch):
+    @contextmanager
+    def fake_open_remote_stdout(command, host, user, ssh_key_path=None):
+        yield io.BytesIO(b"ok\nbad \xff byte\nstill here\n")
+
+    monkeypatch.setattr(remote, "open_remote_stdout", fake_open_remote_stdout)
+
+    assert list(remote.iter_remote_lines("cmd", "ai-box", "user")) == [
+        "ok",
+        "bad � byte",
+        "still here",
+    ]
@@ -0,0 +1,47 @@
+import pytest
+
+from src.preprocessing.parser import _to_iso_utc_from_iso_string
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        # 'Z' suffix, with and without a fraction
+        ("2025-12-06T17:08:56Z", "2025-12-06T17:08:56+00:00"),
+        ("2025-12-06T17:08:56.123Z", "2025-12-06T17:08:56.123000+00:00"),
+        # docker --timestamps: nanoseconds are truncated to microseconds
+        ("2025-12-06T17:08:56.400673015Z", "2025-12-06T17:08:56.400673+00:00"),
+        ("2025-12-06T17:08:56.000000100Z", "2025-12-06T17:08:56+00:00"),
+        # +HH:MM and +HHMM offsets are converted to UTC
+        ("2025-12-06T17:08:56.123456+00:00", "2025-12-06T17:08:56.123456+00:00"),
+        ("2025-12-06T17:08:56.123+02:00", "2025-12-06T15:08:56.123000+00:00"),
+        ("2025-12-06T17:08:56-0530", "2025-12-06T22:38:56+00:00"),
+        # naive timestamps are assumed to be UTC
+        ("2025-12-06 17:08:56", "2025-12-06T17:08:56+00:00"),
+        ("2025-12-06T17:08:56", "2025-12-06T17:08:56+00:00"),
+        # zero microseconds are dropped, as datetime.isoformat() does
+        ("2025-12-06T17:08:56.000000+00:00", "2025-12-06T17:08:56+00:00"),
+        ("2025-12-06T17:08:56.000000000Z", "2025-12-06T17:08:56+00:00"),
+        # comma decimal separator, in fast-path-shaped inputs
+        ("2025-12-06T17:08:56,400673015Z", "2025-12-06T17:08:56.400673+00:00"),
+        ("2025-12-06T17:08:56,123456+00:00", "2025-12-06T17:08:56.123456+00:00"),
+        # offsets other than UTC in fast-path-shaped inputs
+        ("2025-12-06T17:08:56+02:00", "2025-12-06T15:08:56+00:00"),
+        ("2025-12-06T17:08:56.123456-01:00", "2025-12-06T18:08:56.123456+00:00"),
+        # invalid dates and garbage, including in the collector-shaped
+        # inputs that take the fast paths
+        ("2025-13-06T17:08:56Z", None),
+        ("2025-02-30T17:08:56.123456+00:00", None),
+        ("2025-12-06T25:08:56.400673015Z", None),
+        ("2025-12-06T17:08:5xZ", None),
+        ("abcd-ef-ghTij:kl:mnZ", None),
+        ("2025-12-06T17:08:56.40067x015Z", None),
+        ("2025-13-06T17:08:56+02:00", None),
+        ("2025-02-30T17:08:56.5-01:00", None),
+        ("not a timestamp", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_to_iso_utc_from_iso_string(raw, expected):
+    assert _to_iso_utc_from_iso_string(raw) == expected